@@ -6,110 +6,70 @@ Redmineからチケットとその添付ファイルを削除するメインス
 
 import argparse
 import asyncio
+import functools
 import logging
-import logging.handlers
 import os
 import sys
 import time
 from pathlib import Path
-
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING
 
 # srcディレクトリをPythonパスに追加
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
-from redmine_browser_client import RedmineBrowserClient, get_browser_settings
+from bootstrap import load_environment_file, log_queue, parse_bool, setup_logging
+from browser_settings import get_browser_settings
+from rate_limiter import RateLimiter, get_rate_limit_settings
 from redmine_client import RedmineClient
 
-# ログディレクトリの作成
-log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
-
-
-# ログ設定
-def setup_logging():
-    """ログ設定を初期化"""
-    # ログファイルのパス
-    log_file = log_dir / "redmine_deleter.log"
-
-    # フォーマッターの設定
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-
-    # ローテーティングファイルハンドラーの設定
-    # 最大10MB、バックアップファイル5個まで保持
-    file_handler = logging.handlers.RotatingFileHandler(
-        log_file, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"  # 10MB
-    )
-    file_handler.setFormatter(formatter)
-    file_handler.setLevel(logging.DEBUG)
-
-    # コンソールハンドラーの設定
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    console_handler.setLevel(logging.INFO)
-
-    # ルートロガーの設定
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
-
-    # アプリケーションロガーの設定
-    logger = logging.getLogger(__name__)
-    logger.info(f"ログファイル: {log_file.absolute()}")
-
-    return logger
-
+# Playwrightの読み込みは時間がかかるため、型チェック時以外は使用箇所で遅延インポートする
+if TYPE_CHECKING:
+    from redmine_browser_client import RedmineBrowserClient
 
 # ログ設定を初期化
-logger = setup_logging()
-
+setup_logging("redmine_deleter.log")
+logger = logging.getLogger(__name__)
 
 # .envファイルを読み込む
-def load_environment_file():
-    """
-    .envファイルから環境変数を読み込む
-    カレントディレクトリ、プロジェクトルート、ホームディレクトリの順に探索
-    """
-    env_paths = [
-        ".env",  # カレントディレクトリ
-        os.path.join(os.path.dirname(__file__), "..", ".env"),  # プロジェクトルート
-        os.path.expanduser("~/.env"),  # ホームディレクトリ
-    ]
-
-    for env_path in env_paths:
-        if os.path.exists(env_path):
-            load_dotenv(env_path)
-            logger.info(f".envファイルを読み込みました: {env_path}")
-            return
+load_environment_file()
 
-    logger.info(".envファイルは見つかりませんでした。環境変数を使用します。")
 
+# 環境変数から読み込む設定: (設定キー, 環境変数名, 変換関数, デフォルト値)
+_ENV_SPEC = [
+    ("base_url", "REDMINE_BASE_URL", str, None),
+    ("api_key", "REDMINE_API_KEY", str, None),
+    ("username", "REDMINE_USERNAME", str, None),
+    ("password", "REDMINE_PASSWORD", str, None),
+    ("limit", "REDMINE_LIMIT", int, "10"),
+    ("offset_start", "REDMINE_OFFSET_START", int, "0"),
+    ("offset_end", "REDMINE_OFFSET_END", int, "0"),
+    ("sort", "REDMINE_SORT", str, "created_on:asc"),
+    ("only_with_attachments", "REDMINE_ONLY_WITH_ATTACHMENTS", parse_bool, "false"),
+    ("request_interval", "REDMINE_REQUEST_INTERVAL", float, "1.0"),
+    ("verify_ssl", "REDMINE_VERIFY_SSL", parse_bool, "true"),
+    ("retry_count", "REDMINE_RETRY_COUNT", int, "3"),
+    ("retry_interval", "REDMINE_RETRY_INTERVAL", float, "5.0"),
+]
+
+
+@functools.lru_cache(maxsize=1)
+def setup_environment():
+    """環境変数から設定を読み込み（結果はキャッシュされる）"""
+    config = {}
+    for key, env_name, convert, default in _ENV_SPEC:
+        value = os.getenv(env_name, default)
+        config[key] = convert(value) if value is not None else None
 
-# .envファイルを読み込む
-load_environment_file()
+    # 必須項目のチェック（Playwrightを読み込む前に行う）
+    if not config["base_url"]:
+        raise ValueError("REDMINE_BASE_URL環境変数が設定されていません")
 
+    if not config["username"] or not config["password"]:
+        raise ValueError(
+            "ブラウザ操作用の認証情報が不足しています。REDMINE_USERNAME/REDMINE_PASSWORDを設定してください"
+        )
 
-def setup_environment():
-    """環境変数から設定を読み込み"""
-    config = {
-        "base_url": os.getenv("REDMINE_BASE_URL"),
-        "api_key": os.getenv("REDMINE_API_KEY"),
-        "username": os.getenv("REDMINE_USERNAME"),
-        "password": os.getenv("REDMINE_PASSWORD"),
-        "limit": int(os.getenv("REDMINE_LIMIT", "10")),
-        "offset_start": int(os.getenv("REDMINE_OFFSET_START", "0")),
-        "offset_end": int(os.getenv("REDMINE_OFFSET_END", "0")),
-        "sort": os.getenv("REDMINE_SORT", "created_on:asc"),
-        "request_interval": float(os.getenv("REDMINE_REQUEST_INTERVAL", "1.0")),
-        "verify_ssl": os.getenv("REDMINE_VERIFY_SSL", "true").lower() == "true",
-        "retry_count": int(os.getenv("REDMINE_RETRY_COUNT", "3")),
-        "retry_interval": float(os.getenv("REDMINE_RETRY_INTERVAL", "5.0")),
-    }
-
-    # ブラウザ設定を取得
+    # ブラウザ設定を取得（Playwrightの読み込みは必要になった時点で行う）
     (
         browser_base_url,
         headless,
@@ -118,6 +78,7 @@ def setup_environment():
         retry_count,
         retry_interval,
         auth_method,
+        concurrency,
     ) = get_browser_settings()
     config.update(
         {
@@ -128,20 +89,20 @@ def setup_environment():
             "browser_retry_count": retry_count,
             "browser_retry_interval": retry_interval,
             "auth_method": auth_method,
+            "delete_concurrency": concurrency,
         }
     )
 
-    # 必須項目のチェック
-    if not config["base_url"]:
-        raise ValueError("REDMINE_BASE_URL環境変数が設定されていません")
-
     if not config["browser_base_url"]:
         raise ValueError("REDMINE_BROWSER_BASE_URL環境変数が設定されていません")
 
-    if not config["username"] or not config["password"]:
-        raise ValueError(
-            "ブラウザ操作用の認証情報が不足しています。REDMINE_USERNAME/REDMINE_PASSWORDを設定してください"
-        )
+    # レート制限設定を取得
+    rate_per_sec, rate_per_min = get_rate_limit_settings()
+    config.update({"rate_per_sec": rate_per_sec, "rate_per_min": rate_per_min})
+
+    # レート制限を使用する場合は固定間隔の待機を行わない
+    if rate_per_sec > 0 or rate_per_min > 0:
+        config["request_interval"] = 0.0
 
     if not config["api_key"]:
         logger.warning(
@@ -151,6 +112,25 @@ def setup_environment():
     return config
 
 
+def filter_issues_with_attachments(issues) -> list:
+    """添付ファイルが存在するチケットの情報を抽出"""
+    issues_with_attachments = []
+    for issue in issues:
+        if issue.has_attachments():
+            attachments = issue.get_attachments()
+            issues_with_attachments.append(
+                {
+                    "id": issue.id,
+                    "subject": issue.subject,
+                    "attachment_count": len(attachments),
+                }
+            )
+            logger.info(
+                f"  添付ファイルあり: チケット {issue.id} ({len(attachments)}件)"
+            )
+    return issues_with_attachments
+
+
 async def get_issues_with_attachments(client: RedmineClient, config: dict):
     """添付ファイルが存在するチケットを取得"""
     try:
@@ -165,25 +145,44 @@ async def get_issues_with_attachments(client: RedmineClient, config: dict):
         )
         logger.info(f"リクエスト間隔: {request_interval}秒")
 
+        # リクエスト間隔を設定しない場合は、2ページ目以降を並行して一括取得
+        if request_interval <= 0:
+            issues = await asyncio.to_thread(
+                client.get_all_issues,
+                limit=limit,
+                offset_start=offset_start,
+                offset_end=offset_end,
+                sort=sort,
+                only_with_attachments=config["only_with_attachments"],
+            )
+            logger.info(f"{len(issues)}件のチケットを取得しました")
+
+            issues_with_attachments = filter_issues_with_attachments(issues)
+            logger.info(
+                f"添付ファイルが存在するチケット: {len(issues_with_attachments)}件"
+            )
+            return issues_with_attachments
+
         issues_with_attachments = []
         current_offset = offset_start
         batch_count = 0
 
-        while True:
-            # offset_endが設定されている場合の範囲チェック
-            if offset_end > 0 and current_offset >= offset_end:
-                logger.info(
-                    f"指定された範囲の終端に到達しました: {current_offset} >= {offset_end}"
-                )
-                break
-
+        # offset_endが設定されている場合の範囲チェック
+        if offset_end > 0 and current_offset >= offset_end:
+            logger.info(
+                f"指定された範囲の終端に到達しました: {current_offset} >= {offset_end}"
+            )
+        while offset_end <= 0 or current_offset < offset_end:
             logger.info(
                 f"チケット一覧を取得中... (offset={current_offset}, limit={limit})"
             )
 
             try:
                 issues = client.get_issues(
-                    limit=limit, offset=current_offset, sort=sort
+                    limit=limit,
+                    offset=current_offset,
+                    sort=sort,
+                    only_with_attachments=config["only_with_attachments"],
                 )
             except Exception as e:
                 logger.error(f"チケット取得エラー (offset={current_offset}): {e}")
@@ -200,19 +199,7 @@ async def get_issues_with_attachments(client: RedmineClient, config: dict):
             )
 
             # 添付ファイルが存在するチケットをフィルタリング
-            for issue in issues:
-                if issue.has_attachments():
-                    attachments = issue.get_attachments()
-                    issues_with_attachments.append(
-                        {
-                            "id": issue.id,
-                            "subject": issue.subject,
-                            "attachment_count": len(attachments),
-                        }
-                    )
-                    logger.info(
-                        f"  添付ファイルあり: チケット {issue.id} ({len(attachments)}件)"
-                    )
+            issues_with_attachments.extend(filter_issues_with_attachments(issues))
 
             # 次のバッチのためにオフセットを更新
             current_offset += limit
@@ -224,7 +211,21 @@ async def get_issues_with_attachments(client: RedmineClient, config: dict):
                 )
                 break
 
-            # リクエスト間隔を設定（最後のバッチでない場合）
+            # total_countに到達した場合は空のページを確認せずに終了
+            if issues.total_count is not None and current_offset >= issues.total_count:
+                logger.info(
+                    f"最後のバッチです (offset={current_offset} >= total_count={issues.total_count})"
+                )
+                break
+
+            # offset_endに到達した場合は待機せずに終了
+            if offset_end > 0 and current_offset >= offset_end:
+                logger.info(
+                    f"指定された範囲の終端に到達しました: {current_offset} >= {offset_end}"
+                )
+                break
+
+            # リクエスト間隔を設定（次のバッチを取得する場合のみ）
             if request_interval > 0:
                 logger.info(f"リクエスト間隔待機: {request_interval}秒")
                 await asyncio.sleep(request_interval)
@@ -240,7 +241,7 @@ async def get_issues_with_attachments(client: RedmineClient, config: dict):
 
 
 async def delete_attachments_from_issues(
-    browser_client: RedmineBrowserClient, issues_with_attachments: list
+    browser_client: "RedmineBrowserClient", issues_with_attachments: list
 ):
     """添付ファイルを削除"""
     try:
@@ -256,13 +257,13 @@ async def delete_attachments_from_issues(
         # ブラウザクライアントで削除を実行
         results = await browser_client.delete_attachments_from_issues(issue_ids)
 
+        # チケットIDからチケット情報を引けるようにする
+        issues_by_id = {issue["id"]: issue for issue in issues_with_attachments}
+
         # 結果を詳細にログ出力
         success_count = 0
         for issue_id, success in results.items():
-            issue_info = next(
-                (issue for issue in issues_with_attachments if issue["id"] == issue_id),
-                None,
-            )
+            issue_info = issues_by_id.get(issue_id)
             if success:
                 success_count += 1
                 logger.info(
@@ -288,16 +289,18 @@ async def main():
 
         # Redmine APIクライアントを初期化
         logger.info("Redmine APIクライアントを初期化中...")
-        api_client = RedmineClient(
+        with RedmineClient(
             base_url=config["base_url"],
             api_key=config["api_key"],
             username=config["username"],
             password=config["password"],
             verify_ssl=config["verify_ssl"],
-        )
-
-        # 添付ファイルが存在するチケットを取得
-        issues_with_attachments = await get_issues_with_attachments(api_client, config)
+            rate_limiter=RateLimiter(config["rate_per_sec"], config["rate_per_min"]),
+        ) as api_client:
+            # 添付ファイルが存在するチケットを取得
+            issues_with_attachments = await get_issues_with_attachments(
+                api_client, config
+            )
 
         if not issues_with_attachments:
             logger.info("削除対象のチケットがありません。処理を終了します。")
@@ -322,6 +325,8 @@ async def main():
         )
         if not confirm_skip:
             try:
+                # 削除対象の一覧が出力されてから確認プロンプトを表示する
+                log_queue.join()
                 response = input("\n本当に削除しますか？ (yes/no): ").strip().lower()
                 if response not in ["yes", "y"]:
                     logger.info("ユーザーによって削除がキャンセルされました")
@@ -332,26 +337,33 @@ async def main():
 
         # Redmineブラウザクライアントを初期化
         logger.info("Redmineブラウザクライアントを初期化中...")
-        async with RedmineBrowserClient(
-            base_url=config["browser_base_url"],
-            username=config["username"],
-            password=config["password"],
-            headless=config["browser_headless"],
-            timeout=config["browser_timeout"],
-            delete_interval=config["delete_interval"],
-            retry_count=config["browser_retry_count"],
-            retry_interval=config["browser_retry_interval"],
-            auth_method=config["auth_method"],
-        ) as browser_client:
-            # ログイン
-            if not await browser_client.login():
-                logger.error("ログインに失敗しました。処理を終了します。")
-                return
+        from redmine_browser_client import RedmineBrowserClient, close_browser_pools
+
+        try:
+            async with RedmineBrowserClient(
+                base_url=config["browser_base_url"],
+                username=config["username"],
+                password=config["password"],
+                headless=config["browser_headless"],
+                timeout=config["browser_timeout"],
+                delete_interval=config["delete_interval"],
+                retry_count=config["browser_retry_count"],
+                retry_interval=config["browser_retry_interval"],
+                auth_method=config["auth_method"],
+                concurrency=config["delete_concurrency"],
+            ) as browser_client:
+                # ログイン
+                if not await browser_client.login():
+                    logger.error("ログインに失敗しました。処理を終了します。")
+                    return
 
-            # 添付ファイルを削除
-            await delete_attachments_from_issues(
-                browser_client, issues_with_attachments
-            )
+                # 添付ファイルを削除
+                await delete_attachments_from_issues(
+                    browser_client, issues_with_attachments
+                )
+        finally:
+            # 共有ブラウザを終了
+            await close_browser_pools()
 
         logger.info("処理が正常に完了しました")
 
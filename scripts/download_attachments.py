@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Redmine添付ファイルダウンローダー
+Redmineからチケットとその添付ファイルをダウンロードするメインスクリプト
+"""
+
+import argparse
+import asyncio
+import functools
+import logging
+import os
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+# srcディレクトリをPythonパスに追加
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from bootstrap import load_environment_file, parse_bool, setup_logging
+from rate_limiter import RateLimiter, get_rate_limit_settings
+from redmine_client import RedmineClient
+
+# ログ設定を初期化
+setup_logging("redmine_downloader.log")
+logger = logging.getLogger(__name__)
+
+# .envファイルを読み込む
+load_environment_file()
+
+
+# 環境変数から読み込む設定: (設定キー, 環境変数名, 変換関数, デフォルト値)
+_ENV_SPEC = [
+    ("base_url", "REDMINE_BASE_URL", str, None),
+    ("api_key", "REDMINE_API_KEY", str, None),
+    ("username", "REDMINE_USERNAME", str, None),
+    ("password", "REDMINE_PASSWORD", str, None),
+    ("download_dir", "REDMINE_DOWNLOAD_DIR", str, "downloads"),
+    ("limit", "REDMINE_LIMIT", int, "10"),
+    ("offset_start", "REDMINE_OFFSET_START", int, "0"),
+    ("offset_end", "REDMINE_OFFSET_END", int, "0"),
+    ("sort", "REDMINE_SORT", str, "created_on:asc"),
+    ("only_with_attachments", "REDMINE_ONLY_WITH_ATTACHMENTS", parse_bool, "false"),
+    ("clear_downloads", "REDMINE_CLEAR_DOWNLOADS", parse_bool, "true"),
+    ("request_interval", "REDMINE_REQUEST_INTERVAL", float, "1.0"),
+    ("download_interval", "REDMINE_DOWNLOAD_INTERVAL", float, "0.5"),
+    ("verify_ssl", "REDMINE_VERIFY_SSL", parse_bool, "true"),
+    ("retry_count", "REDMINE_RETRY_COUNT", int, "3"),
+    ("retry_interval", "REDMINE_RETRY_INTERVAL", float, "5.0"),
+    ("workers", "REDMINE_WORKERS", int, "4"),
+    ("download_concurrency", "REDMINE_DOWNLOAD_CONCURRENCY", int, "8"),
+]
+
+
+@functools.lru_cache(maxsize=1)
+def setup_environment():
+    """環境変数から設定を読み込み（結果はキャッシュされる）"""
+    config = {}
+    for key, env_name, convert, default in _ENV_SPEC:
+        value = os.getenv(env_name, default)
+        config[key] = convert(value) if value is not None else None
+
+    # レート制限設定を取得
+    rate_per_sec, rate_per_min = get_rate_limit_settings()
+    config.update({"rate_per_sec": rate_per_sec, "rate_per_min": rate_per_min})
+
+    # レート制限を使用する場合は固定間隔の待機を行わない
+    if rate_per_sec > 0 or rate_per_min > 0:
+        config["request_interval"] = 0.0
+        config["download_interval"] = 0.0
+
+    # 必須項目のチェック
+    if not config["base_url"]:
+        raise ValueError("REDMINE_BASE_URL環境変数が設定されていません")
+
+    if not config["api_key"] and (not config["username"] or not config["password"]):
+        raise ValueError(
+            "認証情報が不足しています。REDMINE_API_KEYまたはREDMINE_USERNAME/REDMINE_PASSWORDを設定してください"
+        )
+
+    if config["workers"] < 1:
+        raise ValueError("REDMINE_WORKERSには1以上の値を設定してください")
+
+    if config["download_concurrency"] < 1:
+        raise ValueError("REDMINE_DOWNLOAD_CONCURRENCYには1以上の値を設定してください")
+
+    return config
+
+
+def remove_directory_entry(entry: os.DirEntry):
+    """ディレクトリエントリを削除（ディレクトリの場合は中身ごと削除）"""
+    if entry.is_dir(follow_symlinks=False):
+        shutil.rmtree(entry.path)
+    else:
+        os.unlink(entry.path)
+
+
+def clear_directory(path: Path, max_workers: int = 8):
+    """ディレクトリの中身を並列に削除"""
+    with os.scandir(path) as entries, ThreadPoolExecutor(max_workers) as executor:
+        # 各エントリの削除を並列実行し、エラーがあれば呼び出し元に送出
+        for _ in executor.map(remove_directory_entry, entries):
+            pass
+
+
+def remove_directory_in_background(path: Path) -> threading.Thread:
+    """ディレクトリをバックグラウンドスレッドで削除"""
+
+    def remove():
+        try:
+            shutil.rmtree(path)
+            logger.info(f"旧ダウンロードディレクトリを削除しました: {path}")
+        except Exception as e:
+            logger.error(f"旧ダウンロードディレクトリの削除に失敗しました: {path}: {e}")
+
+    # 削除が終わる前にスクリプトが終了しないよう、デーモンスレッドにはしない
+    thread = threading.Thread(target=remove, name="download-dir-cleanup")
+    thread.start()
+    return thread
+
+
+def create_download_directory(download_dir: str, clear_downloads: bool = True):
+    """ダウンロードディレクトリを作成・クリア"""
+    path = Path(download_dir)
+
+    if clear_downloads and path.exists():
+        logger.info(f"ダウンロードディレクトリをクリア中: {path.absolute()}")
+        try:
+            # 旧ディレクトリを退避してから削除することで、削除を待たずにダウンロードを開始する
+            old_path = path.with_name(f"{path.name}.old.{int(time.time())}")
+            path.rename(old_path)
+            remove_directory_in_background(old_path)
+            logger.info(f"旧ダウンロードディレクトリを退避しました: {old_path}")
+        except OSError as e:
+            # 別デバイスのマウントポイントや使用中のファイルがある場合などは退避できないため、その場で削除
+            logger.debug(f"ダウンロードディレクトリを退避できませんでした: {e}")
+            try:
+                clear_directory(path)
+                logger.info("ダウンロードディレクトリをクリアしました")
+            except Exception as e:
+                logger.error(f"ダウンロードディレクトリのクリアに失敗しました: {e}")
+                raise
+
+    path.mkdir(parents=True, exist_ok=True)
+    logger.info(f"ダウンロードディレクトリを作成しました: {path.absolute()}")
+
+
+def download_issue_attachments(
+    issue,
+    download_dir: str,
+    download_interval: float,
+    retry_count: int,
+    retry_interval: float,
+    executor: Optional[Executor] = None,
+) -> Path:
+    """チケット1件分の添付ファイルをダウンロード（ワーカースレッドで実行）"""
+    # チケットIDごとのディレクトリを作成（既存のファイルはダウンロード時に上書き）
+    issue_dir = Path(download_dir) / f"{issue.id}"
+    issue_dir.mkdir(parents=True, exist_ok=True)
+
+    # 添付ファイルをダウンロード
+    issue.download_attachments(
+        str(issue_dir),
+        download_interval,
+        retry_count,
+        retry_interval,
+        executor,
+    )
+    return issue_dir
+
+
+async def download_issue_attachments_async(
+    issue, config: dict, executor: Optional[Executor] = None
+) -> int:
+    """チケット1件分の添付ファイルをダウンロード"""
+    try:
+        # ダウンロードはスレッド内で完了まで実行されるため、完了後の固定待機は不要
+        issue_dir = await asyncio.to_thread(
+            download_issue_attachments,
+            issue,
+            config["download_dir"],
+            config["download_interval"],
+            config["retry_count"],
+            config["retry_interval"],
+            executor,
+        )
+        logger.debug(f"  ダウンロード完了: {issue_dir}")
+        return len(issue.get_attachments())
+
+    except Exception as e:
+        logger.error(f"  ダウンロードエラー (チケット {issue.id}): {e}")
+        return 0
+
+
+async def produce_issues(
+    client: RedmineClient, config: dict, queue: asyncio.Queue, worker_count: int
+) -> tuple[int, int]:
+    """
+    チケット一覧を取得し、添付ファイルのあるチケットをキューに投入（プロデューサー）
+
+    Returns:
+        (total_attachments, batch_count): 添付ファイル総数と処理したバッチ数のタプル
+    """
+    offset_start = config["offset_start"]
+    offset_end = config["offset_end"]
+    limit = config["limit"]
+    sort = config["sort"]
+    request_interval = config["request_interval"]
+
+    total_attachments = 0
+    current_offset = offset_start
+    batch_count = 0
+    cancelled = False
+
+    try:
+        # offset_endが設定されている場合の範囲チェック
+        if offset_end > 0 and current_offset >= offset_end:
+            logger.info(
+                f"指定された範囲の終端に到達しました: {current_offset} >= {offset_end}"
+            )
+        while offset_end <= 0 or current_offset < offset_end:
+            logger.info(
+                f"チケット一覧を取得中... (offset={current_offset}, limit={limit})"
+            )
+
+            try:
+                # 一覧取得中も実行中のダウンロードが進むようにスレッドで実行
+                issues = await asyncio.to_thread(
+                    client.get_issues,
+                    limit=limit,
+                    offset=current_offset,
+                    sort=sort,
+                    only_with_attachments=config["only_with_attachments"],
+                )
+            except Exception as e:
+                logger.error(f"チケット取得エラー (offset={current_offset}): {e}")
+                break
+
+            # 取得したチケットがない場合は終了
+            if not issues:
+                logger.info(f"チケットが取得できませんでした (offset={current_offset})")
+                break
+
+            batch_count += 1
+            logger.info(
+                f"バッチ {batch_count}: {len(issues)}件のチケットを取得しました (offset={current_offset})"
+            )
+
+            for i, issue in enumerate(issues, 1):
+                logger.info(
+                    f"チケット {i}/{len(issues)} を処理中: {issue.id} (全体のoffset={current_offset + i - 1})"
+                )
+
+                if issue.has_attachments():
+                    attachments = issue.get_attachments()
+                    total_attachments += len(attachments)
+
+                    logger.info(f"  添付ファイル数: {len(attachments)}")
+
+                    # ワーカーの処理が追いつかない場合はキューに空きができるまで待機
+                    await queue.put(issue)
+                else:
+                    logger.info("  添付ファイルなし")
+
+            # 次のバッチのためにオフセットを更新
+            current_offset += limit
+
+            # 取得件数がlimitより少ない場合は最後のバッチ
+            if len(issues) < limit:
+                logger.info(
+                    f"最後のバッチです (取得件数={len(issues)} < limit={limit})"
+                )
+                break
+
+            # total_countに到達した場合は空のページを確認せずに終了
+            if issues.total_count is not None and current_offset >= issues.total_count:
+                logger.info(
+                    f"最後のバッチです (offset={current_offset} >= total_count={issues.total_count})"
+                )
+                break
+
+            # offset_endに到達した場合は待機せずに終了
+            if offset_end > 0 and current_offset >= offset_end:
+                logger.info(
+                    f"指定された範囲の終端に到達しました: {current_offset} >= {offset_end}"
+                )
+                break
+
+            # リクエスト間隔を設定（次のバッチを取得する場合のみ）
+            if request_interval > 0:
+                logger.info(f"リクエスト間隔待機: {request_interval}秒")
+                await asyncio.sleep(request_interval)
+
+    except asyncio.CancelledError:
+        cancelled = True
+        raise
+    finally:
+        # 各ワーカーに終了を通知
+        # （キャンセル時はワーカーも同時にキャンセルされるため、キューの空きを待たずに終了する）
+        if not cancelled:
+            for _ in range(worker_count):
+                await queue.put(None)
+
+    return total_attachments, batch_count
+
+
+async def consume_issues(
+    queue: asyncio.Queue, config: dict, executor: Optional[Executor] = None
+) -> int:
+    """
+    キューからチケットを取り出して添付ファイルをダウンロード（コンシューマー）
+
+    Returns:
+        ダウンロードした添付ファイル数
+    """
+    downloaded_attachments = 0
+
+    while True:
+        issue = await queue.get()
+        if issue is None:
+            break
+
+        downloaded_attachments += await download_issue_attachments_async(
+            issue, config, executor
+        )
+
+    return downloaded_attachments
+
+
+async def download_attachments(client: RedmineClient, config: dict):
+    """添付ファイルをダウンロード"""
+    try:
+        offset_start = config["offset_start"]
+        offset_end = config["offset_end"]
+        limit = config["limit"]
+        request_interval = config["request_interval"]
+        download_interval = config["download_interval"]
+        retry_count = config["retry_count"]
+        retry_interval = config["retry_interval"]
+        workers = config["workers"]
+        download_concurrency = config["download_concurrency"]
+
+        logger.info(
+            f"ダウンロード範囲: offset_start={offset_start}, offset_end={offset_end}"
+        )
+        logger.info(
+            f"間隔設定: リクエスト間隔={request_interval}秒, ダウンロード間隔={download_interval}秒"
+        )
+        logger.info(
+            f"リトライ設定: リトライ回数={retry_count}回, 初回リトライ間隔={retry_interval}秒（指数バックオフ）"
+        )
+        logger.info(f"ダウンロードワーカー数: {workers}")
+
+        # チケット一覧の取得（1スレッド）と各ワーカーの処理（asyncio.to_thread）を実行するスレッドプール
+        # （デフォルトのスレッド数はCPU数に依存するため、ワーカー数が多い場合に一覧取得が待たされないようにする）
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(workers + 1, thread_name_prefix="issue-worker")
+        )
+
+        # ダウンロード間隔を設定しない場合は、全チケットで共有するスレッドプールで
+        # 添付ファイルを並行ダウンロード（同時ダウンロード数はスレッド数で制限）
+        executor = None
+        if download_interval <= 0:
+            executor = ThreadPoolExecutor(
+                download_concurrency, thread_name_prefix="attachment-download"
+            )
+            logger.info(f"添付ファイルの同時ダウンロード数: {download_concurrency}")
+
+        # チケット一覧の取得とダウンロードをキュー経由でパイプライン化
+        queue = asyncio.Queue(maxsize=2 * limit)
+        try:
+            (total_attachments, batch_count), *downloaded = await asyncio.gather(
+                produce_issues(client, config, queue, workers),
+                *(consume_issues(queue, config, executor) for _ in range(workers)),
+            )
+        except BaseException:
+            # 中断（Ctrl+C）やエラーの場合は未着手のダウンロードを取り消して終了する
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            raise
+        if executor is not None:
+            executor.shutdown()
+        downloaded_attachments = sum(downloaded)
+
+        logger.info(
+            f"ダウンロード完了: {downloaded_attachments}/{total_attachments}件の添付ファイルをダウンロードしました"
+        )
+        logger.info(f"処理したバッチ数: {batch_count}")
+
+    except Exception as e:
+        logger.error(f"ダウンロード処理中にエラーが発生しました: {e}")
+        raise
+
+
+async def main():
+    try:
+        # 設定を取得
+        config = setup_environment()
+
+        # ダウンロードディレクトリを作成・クリア
+        create_download_directory(config["download_dir"], config["clear_downloads"])
+
+        # Redmineクライアントを初期化
+        logger.info("Redmineクライアントを初期化中...")
+        with RedmineClient(
+            base_url=config["base_url"],
+            api_key=config["api_key"],
+            username=config["username"],
+            password=config["password"],
+            verify_ssl=config["verify_ssl"],
+            rate_limiter=RateLimiter(config["rate_per_sec"], config["rate_per_min"]),
+            # 同時ダウンロード数 + チケット一覧取得用
+            pool_size=max(config["workers"], config["download_concurrency"]) + 1,
+            download_concurrency=config["download_concurrency"],
+        ) as client:
+            # 添付ファイルをダウンロード
+            await download_attachments(client, config)
+
+        logger.info("処理が正常に完了しました")
+
+    except KeyboardInterrupt:
+        logger.info("ユーザーによって処理が中断されました")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"エラーが発生しました: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    # asyncio.run実行中のCtrl+Cはタスクのキャンセルとして伝わり、終了時にKeyboardInterruptとなる
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.info("ユーザーによって処理が中断されました")
+        sys.exit(1)
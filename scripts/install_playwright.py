@@ -21,22 +21,19 @@ def install_playwright_browsers():
         logger.info("Playwrightのブラウザをインストール中...")
 
         # playwright install コマンドを実行
-        result = subprocess.run(
+        # 出力はキャプチャせず、進捗表示をそのまま端末に出力する
+        subprocess.run(
             [sys.executable, "-m", "playwright", "install", "chromium"],
-            capture_output=True,
-            text=True,
             check=True,
         )
 
         logger.info("Playwrightのブラウザインストールが完了しました")
-        logger.info("出力:")
-        logger.info(result.stdout)
 
         return True
 
     except subprocess.CalledProcessError as e:
+        # エラー内容はコマンドの出力として端末に表示済み
         logger.error(f"Playwrightのブラウザインストールに失敗しました: {e}")
-        logger.error(f"エラー出力: {e.stderr}")
         return False
     except Exception as e:
         logger.error(f"予期しないエラーが発生しました: {e}")
@@ -0,0 +1,99 @@
+"""
+スクリプト共通の初期化処理
+ログ設定と.envファイルの読み込みを行う
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+# ログディレクトリ
+LOG_DIR = Path("logs")
+
+# .envファイルの探索パス（カレントディレクトリ、プロジェクトルート、ホームディレクトリの順）
+ENV_PATHS = [
+    ".env",  # カレントディレクトリ
+    os.path.join(os.path.dirname(__file__), "..", ".env"),  # プロジェクトルート
+    os.path.expanduser("~/.env"),  # ホームディレクトリ
+]
+
+# ログレコードを受け渡すキュー（出力はバックグラウンドスレッドで行う）
+log_queue = queue.Queue(-1)
+
+
+def setup_logging(log_filename: str) -> Path:
+    """
+    ログ設定を初期化
+
+    Args:
+        log_filename: ログディレクトリ内のログファイル名
+
+    Returns:
+        ログファイルのパス
+    """
+    # ログディレクトリの作成
+    LOG_DIR.mkdir(exist_ok=True)
+
+    # ログファイルのパス
+    log_file = LOG_DIR / log_filename
+
+    # フォーマッターの設定
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    # ローテーティングファイルハンドラーの設定
+    # 最大10MB、バックアップファイル5個まで保持
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"  # 10MB
+    )
+    file_handler.setFormatter(formatter)
+    file_handler.setLevel(logging.DEBUG)
+
+    # コンソールハンドラーの設定
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+    console_handler.setLevel(logging.INFO)
+
+    # キューリスナーの設定
+    # ファイル・コンソールへの出力はリスナースレッドで行い、呼び出し元はキューへの投入のみ行う
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    # ルートロガーの設定
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.DEBUG)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    logger.info(f"ログファイル: {log_file.absolute()}")
+
+    return log_file
+
+
+def load_environment_file():
+    """
+    .envファイルから環境変数を読み込む
+    ENV_PATHSの順に探索し、最初に見つかったファイルを使用
+    """
+    env_path = next((path for path in ENV_PATHS if Path(path).is_file()), None)
+    if env_path is None:
+        logger.info(".envファイルは見つかりませんでした。環境変数を使用します。")
+        return
+
+    load_dotenv(env_path)
+    logger.info(f".envファイルを読み込みました: {env_path}")
+
+
+def parse_bool(value: str) -> bool:
+    """環境変数の文字列を真偽値に変換"""
+    return value.lower() == "true"
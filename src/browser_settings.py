@@ -0,0 +1,51 @@
+"""
+ブラウザ操作の設定
+環境変数から添付ファイル削除用のブラウザ設定を取得する（Playwrightを読み込まない）
+"""
+
+import os
+
+
+def get_browser_settings() -> tuple[str, bool, int, float, int, float, str, int]:
+    """
+    環境変数からブラウザ設定を取得
+
+    Returns:
+        (browser_base_url, headless, timeout, delete_interval, retry_count, retry_interval, auth_method, concurrency):
+        ブラウザベースURL、ヘッドレスモード、タイムアウト、削除間隔、リトライ回数、リトライ間隔、認証方式、同時処理数のタプル
+    """
+    # ブラウザのベースURL、デフォルトはローカルのブラウザ
+    browser_base_url = os.getenv("REDMINE_BROWSER_BASE_URL", "")
+
+    # ヘッドレスモード、デフォルトTrue
+    headless = os.getenv("REDMINE_BROWSER_HEADLESS", "true").lower() == "true"
+
+    # ブラウザ操作のタイムアウト（秒）、デフォルト30秒
+    timeout = int(os.getenv("REDMINE_BROWSER_TIMEOUT", "30"))
+
+    # チケット間の待機時間（秒）、直前のチケットの処理開始から数える、デフォルト1.0秒
+    delete_interval = float(os.getenv("REDMINE_DELETE_INTERVAL", "1.0"))
+
+    # 削除失敗時のリトライ回数、デフォルト3回
+    retry_count = int(os.getenv("REDMINE_DELETE_RETRY_COUNT", "3"))
+
+    # リトライ間隔（秒）、デフォルト2.0秒
+    retry_interval = float(os.getenv("REDMINE_DELETE_RETRY_INTERVAL", "2.0"))
+
+    # 認証方式、デフォルトは"login_page"（ログインページ認証）
+    # "basic" または "login_page" を指定可能
+    auth_method = os.getenv("REDMINE_AUTH_METHOD", "login_page").lower()
+
+    # 同時に削除処理を行うチケット数（ページ数）、デフォルト4
+    concurrency = int(os.getenv("REDMINE_DELETE_CONCURRENCY", "4"))
+
+    return (
+        browser_base_url,
+        headless,
+        timeout,
+        delete_interval,
+        retry_count,
+        retry_interval,
+        auth_method,
+        concurrency,
+    )
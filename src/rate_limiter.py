@@ -0,0 +1,123 @@
+"""
+Redmineレートリミッター
+トークンバケット方式でRedmineへのリクエスト数を制限するクラス
+"""
+
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def get_rate_limit_settings() -> tuple[float, float]:
+    """
+    環境変数からレート制限設定を取得
+
+    Returns:
+        (rate_per_sec, rate_per_min): 1秒あたりと1分あたりの最大リクエスト数のタプル
+    """
+    # 1秒あたりの最大リクエスト数、デフォルト0（制限なし）
+    rate_per_sec = float(os.getenv("REDMINE_RATE_PER_SEC", "0"))
+
+    # 1分あたりの最大リクエスト数、デフォルト0（制限なし）
+    rate_per_min = float(os.getenv("REDMINE_RATE_PER_MIN", "0"))
+
+    return rate_per_sec, rate_per_min
+
+
+class TokenBucket:
+    """トークンバケット（スレッドセーフ）
+
+    time_periodあたりmax_rate個のトークンを補充し、バケット容量（max_rate）までの
+    バーストを許可する。
+    max_rateが1未満の場合もリクエストできるよう、容量は最低1とする。
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        """
+        TokenBucketの初期化
+
+        Args:
+            max_rate: 期間あたりの最大リクエスト数
+            time_period: 期間（秒）
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._fill_rate = max_rate / time_period
+        self._capacity = max(1.0, max_rate)
+        self._tokens = self._capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """トークンを1つ取得（不足している場合は補充されるまで待機）"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._last) * self._fill_rate
+                )
+                self._last = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self._fill_rate
+
+            time.sleep(wait)
+
+
+class RateLimiter:
+    """Redmineへのリクエストを制限するレートリミッター
+
+    1秒単位と1分単位のトークンバケットを組み合わせて使用する。
+    複数スレッドから同時に使用可能。
+
+    使用例:
+        limiter = RateLimiter(rate_per_sec=5, rate_per_min=200)
+
+        with limiter:
+            response = session.get(url)
+    """
+
+    def __init__(self, rate_per_sec: float = 0.0, rate_per_min: float = 0.0):
+        """
+        RateLimiterの初期化
+
+        Args:
+            rate_per_sec: 1秒あたりの最大リクエスト数（0の場合は制限なし）
+            rate_per_min: 1分あたりの最大リクエスト数（0の場合は制限なし）
+        """
+        self.rate_per_sec = rate_per_sec
+        self.rate_per_min = rate_per_min
+
+        self._buckets = []
+        if rate_per_sec > 0:
+            self._buckets.append(TokenBucket(rate_per_sec, 1.0))
+        if rate_per_min > 0:
+            self._buckets.append(TokenBucket(rate_per_min, 60.0))
+
+        if self.enabled:
+            logger.info(
+                f"レート制限を有効にしました: {rate_per_sec}回/秒, {rate_per_min}回/分（0は制限なし）"
+            )
+
+    @property
+    def enabled(self) -> bool:
+        """レート制限が有効かどうか"""
+        return bool(self._buckets)
+
+    def acquire(self):
+        """リクエスト1回分の許可を取得（制限に達している場合は待機）"""
+        for bucket in self._buckets:
+            bucket.acquire()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
@@ -7,54 +7,210 @@ import asyncio
 import base64
 import logging
 import os
+import random
+import shutil
 import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from playwright.async_api import Page, Playwright, async_playwright
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import Route
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+# 設定の取得はPlaywrightを読み込まずに行えるよう別モジュールに定義（互換性のため再エクスポート）
+from browser_settings import get_browser_settings  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
+# 削除処理に不要なため読み込みを中止するリソースの種類
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+
+async def _block_unneeded_resources(route: Route):
+    """画像・フォント・メディア・スタイルシートの読み込みを中止"""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# 削除確認ダイアログを表示せずに常に承認するスクリプト（ページ読み込み前に注入する）
+_AUTO_CONFIRM_SCRIPT = "window.confirm = () => true; window.alert = () => {};"
+
+# 削除リンクのURLにDELETEリクエストをまとめて送信し、各リクエストの成否を返すスクリプト
+# RailsのCSRF対策のため、ページのmetaタグからトークンを取得してヘッダーに付与する
+_BATCH_DELETE_SCRIPT = """
+async (urls) => {
+    const meta = document.querySelector('meta[name="csrf-token"]');
+    const headers = meta ? {'X-CSRF-Token': meta.content} : {};
+    return Promise.all(urls.map(async (url) => {
+        try {
+            const response = await fetch(url, {
+                method: 'DELETE',
+                headers: headers,
+                credentials: 'same-origin',
+            });
+            return response.ok;
+        } catch (e) {
+            return false;
+        }
+    }));
+}
+"""
+
+
+# /dev/shmがこのサイズ未満の場合はChromiumの共有メモリをディスク上に確保する
+_MIN_DEV_SHM_SIZE = 256 * 1024 * 1024
+
+# 起動を軽くするため常に指定するChromiumの起動オプション
+_CHROMIUM_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-background-networking",
+    "--disable-extensions",
+    "--disable-sync",
+    "--disable-translate",
+    "--no-default-browser-check",
+]
 
-def get_browser_settings() -> tuple[str, bool, int, float, int, float, str]:
+
+def get_chromium_launch_args() -> List[str]:
     """
-    環境変数からブラウザ設定を取得
+    実行環境に応じたChromiumの起動オプションを取得
 
     Returns:
-        (browser_base_url, headless, timeout, delete_interval, retry_count, retry_interval, auth_method):
-        ブラウザベースURL、ヘッドレスモード、タイムアウト、削除間隔、リトライ回数、リトライ間隔、認証方式のタプル
+        起動オプションのリスト
     """
-    # ブラウザのベースURL、デフォルトはローカルのブラウザ
-    browser_base_url = os.getenv("REDMINE_BROWSER_BASE_URL", "")
+    args = list(_CHROMIUM_ARGS)
+
+    # /dev/shmが小さい環境（Dockerのデフォルトなど）ではディスクを使用してクラッシュを防ぐ
+    try:
+        if shutil.disk_usage("/dev/shm").total < _MIN_DEV_SHM_SIZE:
+            args.append("--disable-dev-shm-usage")
+    except OSError:
+        # /dev/shmが存在しない環境（Windows・macOS）では不要
+        pass
+
+    # rootユーザーではサンドボックスを使用できないため無効化
+    if hasattr(os, "geteuid") and os.geteuid() == 0:
+        args.append("--no-sandbox")
+
+    return args
+
+
+class BrowserPool:
+    """Playwrightのブラウザとコンテキストを使い回すプール
+
+    ブラウザの起動は一度だけ行い、返却されたコンテキストはCookieと
+    追加ヘッダーを消去して次の利用者に貸し出す。
+
+    使用例:
+        pool = get_browser_pool(headless=True)
+        context = await pool.get_context()
+        try:
+            page = await context.new_page()
+        finally:
+            await pool.release(context)
+    """
+
+    def __init__(self, headless: bool = True):
+        """
+        BrowserPoolの初期化
+
+        Args:
+            headless: ヘッドレスモード（デフォルト: True）
+        """
+        self.headless = headless
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self._idle_contexts: asyncio.Queue = asyncio.Queue()
+        self._lock = asyncio.Lock()
+
+    async def _ensure_browser(self) -> Browser:
+        """ブラウザが起動していなければ起動"""
+        async with self._lock:
+            if self.browser is None:
+                self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.chromium.launch(
+                    headless=self.headless, args=get_chromium_launch_args()
+                )
+                logger.info("ブラウザを起動しました")
+            return self.browser
+
+    async def get_context(self) -> BrowserContext:
+        """
+        コンテキストを取得（空きがない場合は新規作成）
+
+        Returns:
+            ブラウザコンテキスト
+        """
+        browser = await self._ensure_browser()
+        try:
+            return self._idle_contexts.get_nowait()
+        except asyncio.QueueEmpty:
+            return await browser.new_context()
+
+    async def release(self, context: BrowserContext):
+        """
+        コンテキストをプールに返却
 
-    # ヘッドレスモード、デフォルトTrue
-    headless = os.getenv("REDMINE_BROWSER_HEADLESS", "true").lower() == "true"
+        Args:
+            context: 返却するブラウザコンテキスト
+        """
+        try:
+            # 次の利用者に状態を引き継がないようにページ・ルート・Cookie・ヘッダーを消去
+            for page in context.pages:
+                await page.close()
+            await context.unroute_all()
+            await context.clear_cookies()
+            await context.set_extra_http_headers({})
+            self._idle_contexts.put_nowait(context)
+        except Exception as e:
+            logger.warning(f"コンテキストを再利用できないため破棄します: {e}")
+            try:
+                await context.close()
+            except Exception:
+                pass
 
-    # ブラウザ操作のタイムアウト（秒）、デフォルト30秒
-    timeout = int(os.getenv("REDMINE_BROWSER_TIMEOUT", "30"))
+    async def close(self):
+        """ブラウザを終了"""
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+        self._idle_contexts = asyncio.Queue()
+        logger.info("ブラウザを閉じました")
 
-    # 削除操作間の待機時間（秒）、デフォルト1.0秒
-    delete_interval = float(os.getenv("REDMINE_DELETE_INTERVAL", "1.0"))
 
-    # 削除失敗時のリトライ回数、デフォルト3回
-    retry_count = int(os.getenv("REDMINE_DELETE_RETRY_COUNT", "3"))
+# ヘッドレスモードごとの共有ブラウザプール
+_browser_pools: Dict[bool, BrowserPool] = {}
 
-    # リトライ間隔（秒）、デフォルト2.0秒
-    retry_interval = float(os.getenv("REDMINE_DELETE_RETRY_INTERVAL", "2.0"))
 
-    # 認証方式、デフォルトは"login_page"（ログインページ認証）
-    # "basic" または "login_page" を指定可能
-    auth_method = os.getenv("REDMINE_AUTH_METHOD", "login_page").lower()
+def get_browser_pool(headless: bool = True) -> BrowserPool:
+    """
+    共有のブラウザプールを取得
+
+    Args:
+        headless: ヘッドレスモード
 
-    return (
-        browser_base_url,
-        headless,
-        timeout,
-        delete_interval,
-        retry_count,
-        retry_interval,
-        auth_method,
-    )
+    Returns:
+        ヘッドレスモードに対応するBrowserPool
+    """
+    if headless not in _browser_pools:
+        _browser_pools[headless] = BrowserPool(headless)
+    return _browser_pools[headless]
+
+
+async def close_browser_pools():
+    """共有のブラウザプールをすべて終了"""
+    for pool in _browser_pools.values():
+        try:
+            await pool.close()
+        except Exception as e:
+            logger.error(f"ブラウザのクローズ中にエラーが発生しました: {e}")
+    _browser_pools.clear()
 
 
 class RedmineBrowserClient:
@@ -71,6 +227,9 @@ class RedmineBrowserClient:
 
             # チケットの添付ファイルを削除
             await client.delete_attachments_from_issue(123)
+
+        # 共有ブラウザを終了
+        await close_browser_pools()
     """
 
     def __init__(
@@ -84,6 +243,10 @@ class RedmineBrowserClient:
         retry_count: int = 3,
         retry_interval: float = 2.0,
         auth_method: str = "login_page",
+        concurrency: int = 4,
+        retry_backoff_base: float = 2.0,
+        retry_jitter: float = 0.5,
+        retry_max_delay: float = 30.0,
     ):
         """
         RedmineBrowserClientの初期化
@@ -94,12 +257,20 @@ class RedmineBrowserClient:
             password: パスワード
             headless: ヘッドレスモード（デフォルト: True）
             timeout: ブラウザ操作のタイムアウト（秒）
-            delete_interval: 削除操作間の待機時間（秒）
+            delete_interval: チケット間の待機時間（秒）（直前のチケットの処理開始から数える）
             retry_count: 削除失敗時のリトライ回数（デフォルト: 3）
             retry_interval: リトライ間隔（秒）（デフォルト: 2.0）
             auth_method: 認証方式（"basic" または "login_page"）（デフォルト: "login_page"）
+            concurrency: 同時に削除処理を行うチケット数（デフォルト: 4）
+            retry_backoff_base: リトライごとの待機時間の倍率（デフォルト: 2.0）
+            retry_jitter: 待機時間に加えるランダムな揺らぎの割合（デフォルト: 0.5）
+            retry_max_delay: リトライ待機時間の上限（秒）（デフォルト: 30.0）
         """
         self.base_url = base_url.rstrip("/")
+        # チケットごとに組み立てるURLの共通部分
+        self._login_url = self.base_url + "/login"
+        self._issue_url_prefix = self.base_url + "/issues/"
+        self._attachment_url_prefix = self.base_url + "/attachments/"
         self.username = username
         self.password = password
         self.headless = headless
@@ -107,45 +278,73 @@ class RedmineBrowserClient:
         self.delete_interval = delete_interval
         self.retry_count = retry_count
         self.retry_interval = retry_interval
-        self.auth_method = auth_method.lower()
+        self.retry_backoff_base = retry_backoff_base
+        self.retry_jitter = retry_jitter
+        self.retry_max_delay = retry_max_delay
 
-        self.playwright: Optional[Playwright] = None
-        self.browser = None
+        self.auth_method = auth_method.lower()
+        # REST API（.json）へのリクエストではRedmineがセッションCookieを使用しないため、
+        # Basic認証ヘッダーを付与するBasic認証方式の場合のみREST APIで削除する
+        # （権限不足などでREST APIが使用できないと判明した場合もページ操作のみで削除する）
+        self._use_rest_api = self.auth_method == "basic"
+        self.concurrency = max(1, concurrency)
+
+        self.pool: Optional[BrowserPool] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
 
         logger.info(f"Redmineブラウザクライアントを初期化しました: {base_url}")
         logger.info(f"認証方式: {self.auth_method}")
         logger.info(f"ヘッドレスモード: {headless}, タイムアウト: {timeout}秒")
         logger.info(f"リトライ設定: 回数={retry_count}回, 間隔={retry_interval}秒")
+        logger.info(f"同時処理数: {self.concurrency}")
 
     async def _setup_browser(self):
         """ブラウザをセットアップ"""
         try:
-            self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless, args=["--no-sandbox", "--disable-dev-shm-usage"]
-            )
-            self.page = await self.browser.new_page()
+            # 認証情報（ヘッダー・Cookie）を全ページで共有するため、1つのコンテキストからページを作成
+            # ブラウザの起動コストを抑えるため、コンテキストは共有プールから借りる
+            self.pool = get_browser_pool(self.headless)
+            self.context = await self.pool.get_context()
 
             # Basic認証方式の場合のみヘッダーを設定
             if self.auth_method == "basic":
                 token = base64.b64encode(
                     f"{self.username}:{self.password}".encode()
                 ).decode()
-                self.page.set_extra_http_headers(
+                await self.context.set_extra_http_headers(
                     {
                         "Authorization": f"Basic {token}",
                     }
                 )
                 logger.info("Basic認証ヘッダーを設定しました")
 
-            self.page.set_default_timeout(self.timeout)
+            # 削除処理ではHTMLのみ必要なため、画像などの読み込みを省略してページ読み込みを短縮
+            await self.context.route("**/*", _block_unneeded_resources)
+
+            self.context.set_default_timeout(self.timeout)
+            self.page = await self._new_page()
 
             logger.info("ブラウザをセットアップしました")
         except Exception as e:
             logger.error(f"ブラウザのセットアップに失敗しました: {e}")
             raise
 
+    async def _new_page(self) -> Page:
+        """
+        削除処理に使用するページを作成
+
+        確認ダイアログをブラウザ内で承認し、ダイアログのイベント処理を不要にする。
+        コンテキストはプールで使い回され、登録したスクリプトを解除できないため、
+        スクリプトはコンテキストではなく返却時に閉じられるページに登録する。
+
+        Returns:
+            作成したページ
+        """
+        page = await self.context.new_page()
+        await page.add_init_script(_AUTO_CONFIRM_SCRIPT)
+        return page
+
     async def login(self) -> bool:
         """
         Redmineにログイン（認証方式に応じて自動選択）
@@ -155,6 +354,8 @@ class RedmineBrowserClient:
         """
         if self.auth_method == "basic":
             # Basic認証の場合はログイン処理は不要（ヘッダーで認証済み）
+            if not self.page:
+                await self._setup_browser()
             logger.info("Basic認証方式のため、ログイン処理をスキップします")
             return True
         elif self.auth_method == "login_page":
@@ -175,20 +376,19 @@ class RedmineBrowserClient:
                 await self._setup_browser()
 
             # ログインページに移動
-            login_url = f"{self.base_url}/login"
+            login_url = self._login_url
             logger.info(f"ログインページに移動中: {login_url}")
 
             await self.page.goto(login_url)
-            await self.page.wait_for_load_state("networkidle")
 
             # ユーザ名とパスワードを入力
             logger.info("ログイン情報を入力中...")
             await self.page.fill('input[name="username"]', self.username)
             await self.page.fill('input[name="password"]', self.password)
 
-            # ログインボタンをクリック
-            await self.page.click('input[type="submit"]')
-            await self.page.wait_for_load_state("networkidle")
+            # ログインボタンをクリックし、ログイン結果のページへの遷移を待機
+            async with self.page.expect_navigation():
+                await self.page.click('input[type="submit"]')
 
             # ログイン成功の確認（ダッシュボードまたはマイページにリダイレクトされる）
             current_url = self.page.url
@@ -203,32 +403,179 @@ class RedmineBrowserClient:
             logger.error(f"ページログイン処理中にエラーが発生しました: {e}")
             return False
 
-    async def delete_attachments_from_issue(self, issue_id: int) -> bool:
+    def _get_retry_delay(self, attempt: int) -> float:
+        """
+        リトライまでの待機時間を計算（指数バックオフ + ジッター）
+
+        Args:
+            attempt: 失敗した試行の番号（0始まり）
+
+        Returns:
+            待機時間（秒）
+        """
+        delay = min(
+            self.retry_max_delay,
+            self.retry_interval * (self.retry_backoff_base**attempt),
+        )
+        return delay * (1 + random.uniform(0, self.retry_jitter))
+
+    @staticmethod
+    def _is_recoverable_error(error: Exception) -> bool:
+        """
+        リトライで回復が見込めるエラーかどうかを判定
+
+        タイムアウトと通信エラー（net::ERR_*）は一時的なものとして扱い、
+        セレクタや処理の誤りなどそれ以外のエラーはリトライしても結果が変わらないため
+        即座に失敗とする。
+        """
+        if isinstance(error, (PlaywrightTimeoutError, TimeoutError)):
+            return True
+        return isinstance(error, PlaywrightError) and "net::" in str(error)
+
+    async def _delete_attachments_via_api(self, issue_id: int, page: Page) -> bool:
+        """
+        REST APIで添付ファイルを削除（ページの描画を行わない）
+
+        ページのヘッダー（Basic認証）を共有するAPIリクエストで添付ファイル一覧を取得し、
+        各添付ファイルのDELETEリクエストをまとめて送信する。
+        レスポンスがJSONとして解析できない場合（認証プロキシのページなど）は、
+        以降のチケットはページ操作のみで削除する。
+
+        Args:
+            issue_id: チケットID
+            page: 認証情報を共有するページ
+
+        Returns:
+            全ての添付ファイルを削除できた場合はTrue
+        """
+        api = page.request
+        try:
+            response = await api.get(
+                self._issue_url_prefix + f"{issue_id}.json",
+                params={"include": "attachments"},
+            )
+            if response.status in (401, 403):
+                logger.warning(
+                    f"REST APIでの削除が許可されていないため、以降はページ操作で削除します (HTTP {response.status})"
+                )
+                self._use_rest_api = False
+                return False
+            if not response.ok:
+                logger.warning(
+                    f"  REST APIでチケット {issue_id} を取得できませんでした (HTTP {response.status})"
+                )
+                return False
+
+            try:
+                issue = (await response.json())["issue"]
+                attachment_ids = [
+                    attachment["id"] for attachment in issue.get("attachments", [])
+                ]
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                logger.warning(
+                    f"REST APIのレスポンスを解析できないため、以降はページ操作で削除します: {e}"
+                )
+                self._use_rest_api = False
+                return False
+            if not attachment_ids:
+                logger.info(f"チケット {issue_id} には添付ファイルがありません")
+                return True
+
+            logger.info(
+                f"チケット {issue_id} の添付ファイル {len(attachment_ids)} 件をREST APIで削除中..."
+            )
+            responses = await asyncio.gather(
+                *(
+                    api.delete(self._attachment_url_prefix + f"{attachment_id}.json")
+                    for attachment_id in attachment_ids
+                )
+            )
+        except PlaywrightError as e:
+            logger.warning(f"  REST APIでの削除に失敗しました: {e}")
+            return False
+
+        failed_ids = [
+            attachment_id
+            for attachment_id, response in zip(attachment_ids, responses)
+            if not response.ok
+        ]
+        if any(response.status in (401, 403) for response in responses):
+            logger.warning(
+                "REST APIでの削除が許可されていないため、以降はページ操作で削除します"
+            )
+            self._use_rest_api = False
+
+        if failed_ids:
+            logger.warning(
+                f"  REST APIで削除できなかった添付ファイル: {', '.join(map(str, failed_ids))}"
+            )
+            return False
+
+        logger.info(f"チケット {issue_id} の添付ファイル削除が完了しました")
+        return True
+
+    async def _delete_attachments_in_batch(self, page: Page, delete_buttons) -> int:
+        """
+        削除リンクへのDELETEリクエストを1回のevaluateでまとめて送信
+
+        Args:
+            page: 対象のページ
+            delete_buttons: 削除ボタンのロケーター
+
+        Returns:
+            削除に成功した添付ファイルの数
+        """
+        try:
+            urls = await delete_buttons.evaluate_all(
+                "els => els.map(e => e.href).filter(Boolean)"
+            )
+            results = await page.evaluate(_BATCH_DELETE_SCRIPT, urls)
+        except PlaywrightError as e:
+            logger.warning(f"  添付ファイルの一括削除に失敗しました: {e}")
+            return 0
+
+        deleted_count = sum(1 for result in results if result)
+        logger.info(f"  添付ファイル {deleted_count}/{len(urls)} 件を一括削除しました")
+        return deleted_count
+
+    async def delete_attachments_from_issue(
+        self, issue_id: int, page: Optional[Page] = None
+    ) -> bool:
         """
         指定されたチケットの添付ファイルを削除
 
         Args:
             issue_id: チケットID
+            page: 操作に使用するページ（省略時はログインに使用したページ）
 
         Returns:
             削除成功時はTrue
         """
+        if page is None:
+            page = self.page
+
+        # REST APIで削除できた場合はページの読み込み自体を省略
+        if self._use_rest_api and await self._delete_attachments_via_api(
+            issue_id, page
+        ):
+            return True
+
         try:
             # チケットページに移動
-            issue_url = f"{self.base_url}/issues/{issue_id}"
+            issue_url = self._issue_url_prefix + str(issue_id)
             logger.info(f"チケットページに移動中: {issue_url}")
 
-            await self.page.goto(issue_url)
-            await self.page.wait_for_load_state("networkidle")
+            await page.goto(issue_url)
+            await page.wait_for_load_state("networkidle")
 
             # 添付ファイルセクションを確認
-            attachments_section = self.page.locator(".attachments")
+            attachments_section = page.locator(".attachments")
             if not await attachments_section.count():
                 logger.info(f"チケット {issue_id} には添付ファイルがありません")
                 return True
 
             # 削除ボタンを探す
-            delete_buttons = self.page.locator(".attachments .delete")
+            delete_buttons = page.locator(".attachments .delete")
             attachment_count = await delete_buttons.count()
 
             if attachment_count == 0:
@@ -241,14 +588,19 @@ class RedmineBrowserClient:
                 f"チケット {issue_id} の添付ファイル {attachment_count} 件を削除中..."
             )
 
-            # 確認ダイアログのハンドラーを設定
-            async def handle_dialog(dialog):
-                try:
-                    await dialog.accept()
-                except Exception as e:
-                    logger.warning(f"ダイアログ処理中にエラーが発生しました: {e}")
+            # 削除リクエストをまとめて送信し、削除できなかった添付ファイルのみクリックで削除
+            if await self._delete_attachments_in_batch(page, delete_buttons):
+                # 一括削除の結果を反映するためページを再読み込み
+                await page.reload()
+                attachment_count = await delete_buttons.count()
 
-            self.page.on("dialog", handle_dialog)
+                if attachment_count == 0:
+                    logger.info(f"チケット {issue_id} の添付ファイル削除が完了しました")
+                    return True
+
+                logger.info(
+                    f"  一括削除できなかった添付ファイル {attachment_count} 件をクリックで削除します"
+                )
 
             # 各添付ファイルを削除
             failed_attachments = []
@@ -258,13 +610,17 @@ class RedmineBrowserClient:
                 # リトライループ
                 for attempt in range(self.retry_count + 1):  # 初回 + リトライ回数
                     try:
+                        # クリック前の削除ボタン数を記録
+                        before_count = await delete_buttons.count()
+
                         # 削除ボタンをクリック（常に最初の要素を削除）
                         delete_button = delete_buttons.nth(0)
                         await delete_button.click()
 
-                        # 削除完了を待機
-                        await asyncio.sleep(0.5)
-                        await self.page.wait_for_load_state("networkidle")
+                        # 削除ボタンが1つ減る（末尾の削除ボタンがなくなる）まで待機
+                        await delete_buttons.nth(before_count - 1).wait_for(
+                            state="detached"
+                        )
 
                         if attempt > 0:
                             logger.info(
@@ -279,14 +635,13 @@ class RedmineBrowserClient:
                         break
 
                     except Exception as e:
-                        if attempt < self.retry_count:
+                        if attempt < self.retry_count and self._is_recoverable_error(e):
                             logger.warning(
                                 f"  添付ファイル {i + 1}/{attachment_count} の削除に失敗しました ({attempt + 1}/{self.retry_count + 1}回目): {e}"
                             )
-                            logger.info(
-                                f"    {self.retry_interval}秒後にリトライします..."
-                            )
-                            await asyncio.sleep(self.retry_interval)
+                            delay = self._get_retry_delay(attempt)
+                            logger.info(f"    {delay:.1f}秒後にリトライします...")
+                            await asyncio.sleep(delay)
                         else:
                             logger.error(
                                 f"  添付ファイル {i + 1}/{attachment_count} の削除に最終的に失敗しました: {e}"
@@ -300,15 +655,7 @@ class RedmineBrowserClient:
                                     "error": str(e),
                                 }
                             )
-                            continue
-
-                # 削除間隔を設定（最後のファイルでない場合）
-                if self.delete_interval > 0 and i < attachment_count - 1:
-                    logger.debug(f"  削除間隔待機: {self.delete_interval}秒")
-                    await asyncio.sleep(self.delete_interval)
-
-            # ダイアログハンドラーを削除
-            self.page.remove_listener("dialog", handle_dialog)
+                            break
 
             # 失敗した添付ファイルがある場合は手動削除用のログを出力
             if failed_attachments:
@@ -341,33 +688,73 @@ class RedmineBrowserClient:
         Returns:
             削除結果の辞書 {issue_id: success}
         """
-        results = {}
         all_failed_attachments = []
+        total = len(issue_ids)
+        started = 0
+
+        logger.info(f"{total} 件のチケットの添付ファイル削除を開始します")
+
+        # ページを同時処理数分用意し、キューで貸し出す（キューが同時実行数の上限を兼ねる）
+        page_pool: asyncio.Queue = asyncio.Queue()
+        extra_pages = [
+            await self._new_page()
+            for _ in range(min(self.concurrency, total) - 1)
+        ]
+        for page in [self.page, *extra_pages]:
+            page_pool.put_nowait(page)
+
+        # ページごとの直前のチケット処理開始時刻
+        last_started: Dict[Page, float] = {}
+
+        async def delete_with_pooled_page(issue_id: int) -> bool:
+            nonlocal started
+            page = await page_pool.get()
+            try:
+                # 直前のチケットの処理開始から間隔が経過するまで待機
+                # （直前のチケットの処理時間は待機時間に含め、待機と処理を重ねる）
+                previous = last_started.get(page)
+                if previous is not None and self.delete_interval > 0:
+                    wait = self.delete_interval - (time.monotonic() - previous)
+                    if wait > 0:
+                        logger.debug(f"チケット間隔待機: {wait:.1f}秒")
+                        await asyncio.sleep(wait)
+                last_started[page] = time.monotonic()
+
+                started += 1
+                logger.info(f"チケット {started}/{total} を処理中: {issue_id}")
+                return await self.delete_attachments_from_issue(issue_id, page)
+            finally:
+                page_pool.put_nowait(page)
 
-        logger.info(f"{len(issue_ids)} 件のチケットの添付ファイル削除を開始します")
-
-        for i, issue_id in enumerate(issue_ids, 1):
-            logger.info(f"チケット {i}/{len(issue_ids)} を処理中: {issue_id}")
-
-            success = await self.delete_attachments_from_issue(issue_id)
-            results[issue_id] = success
+        try:
+            outcomes = await asyncio.gather(
+                *(delete_with_pooled_page(issue_id) for issue_id in issue_ids),
+                return_exceptions=True,
+            )
+        finally:
+            for page in extra_pages:
+                await page.close()
 
-            # 最後のチケットでない場合は間隔を設定
-            if i < len(issue_ids) and self.delete_interval > 0:
-                logger.debug(f"チケット間隔待機: {self.delete_interval}秒")
-                await asyncio.sleep(self.delete_interval)
+        results = {}
+        for issue_id, outcome in zip(issue_ids, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    f"チケット {issue_id} の添付ファイル削除中にエラーが発生しました: {outcome}"
+                )
+                outcome = False
+            results[issue_id] = outcome
 
-        # 結果を集計
-        success_count = sum(1 for success in results.values() if success)
-        failed_count = len(issue_ids) - success_count
+        # 結果を集計（失敗したチケットを1回の走査で抽出）
+        failed_issue_ids = [
+            issue_id for issue_id, success in results.items() if not success
+        ]
+        failed_count = len(failed_issue_ids)
+        success_count = len(results) - failed_count
 
-        logger.info(f"削除完了: {success_count}/{len(issue_ids)} 件のチケットで成功")
+        logger.info(f"削除完了: {success_count}/{total} 件のチケットで成功")
 
         # 失敗したチケットがある場合はサマリーを出力
         if failed_count > 0:
-            failed_issue_ids = [
-                issue_id for issue_id, success in results.items() if not success
-            ]
             logger.error(f"=== 削除失敗チケット一覧 ===")
             for issue_id in failed_issue_ids:
                 logger.error(f"[DELETE_FAILED] チケット {issue_id}")
@@ -379,13 +766,13 @@ class RedmineBrowserClient:
         return results
 
     async def close(self):
-        """ブラウザを閉じる"""
+        """コンテキストをプールに返却（ブラウザの終了はclose_browser_poolsで行う）"""
         try:
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
-            logger.info("ブラウザを閉じました")
+            if self.context:
+                await self.pool.release(self.context)
+                self.context = None
+                self.page = None
+                logger.info("ブラウザコンテキストを返却しました")
         except Exception as e:
             logger.error(f"ブラウザのクローズ中にエラーが発生しました: {e}")
 
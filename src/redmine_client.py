@@ -3,24 +3,53 @@ Redmine APIクライアント
 requestsライブラリを使用してRedmine REST APIからチケットと添付ファイルを取得するクラス
 """
 
+import functools
 import json
 import logging
 import os
+import random
 import re
+import shutil
 import time
 import urllib.parse
 from collections.abc import Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limiter import RateLimiter
+
+try:
+    import orjson
+except ImportError:  # orjsonが未インストールの場合は標準ライブラリのjsonを使用
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def parse_json(content: bytes):
+    """
+    JSONのバイト列を解析（orjsonがインストールされていれば使用）
+
+    Args:
+        content: レスポンスボディのバイト列
+
+    Returns:
+        解析結果
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+@functools.lru_cache(maxsize=1)
 def get_timeout_settings() -> tuple[int, int]:
     """
-    環境変数からタイムアウト設定を取得
+    環境変数からタイムアウト設定を取得（結果はキャッシュされる）
 
     Returns:
         (base_timeout, timeout_increment): 基本タイムアウト時間と増加時間のタプル
@@ -34,9 +63,10 @@ def get_timeout_settings() -> tuple[int, int]:
     return base_timeout, timeout_increment
 
 
+@functools.lru_cache(maxsize=1)
 def get_retry_settings() -> tuple[int, float]:
     """
-    環境変数からリトライ設定を取得
+    環境変数からリトライ設定を取得（結果はキャッシュされる）
 
     Returns:
         (retry_count, retry_interval): リトライ回数とリトライ間隔のタプル
@@ -50,11 +80,115 @@ def get_retry_settings() -> tuple[int, float]:
     return retry_count, retry_interval
 
 
+# リトライ間隔の上限（秒）
+MAX_RETRY_INTERVAL = 60.0
+
+# ファイルダウンロード時にディスクへ書き込む単位（バイト）
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# ファイル名に使用できない文字（Windows/Unix両方で使用できない文字）
+_DANGEROUS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+# ファイル名の先頭・末尾から除去する文字
+_STRIP_CHARS = " ."
+
+_unquote = urllib.parse.unquote
+
+
+@functools.lru_cache(maxsize=4096)
+def _sanitize(filename: str) -> tuple[str, str]:
+    """
+    ファイル名をデコードして安全な形式に変換（結果はキャッシュされる）
+
+    Args:
+        filename: 元のファイル名
+
+    Returns:
+        (decoded_filename, safe_filename): デコード後のファイル名と安全なファイル名のタプル
+    """
+    # URLエンコードされたファイル名をデコード
+    try:
+        decoded_filename = _unquote(filename)
+    except Exception as e:
+        logger.warning(f"ファイル名のデコードに失敗しました: {filename}, エラー: {e}")
+        decoded_filename = filename
+
+    # 危険な文字を置換し、先頭・末尾の空白とドットを除去
+    safe_filename = _DANGEROUS_RE.sub("_", decoded_filename).strip(_STRIP_CHARS)
+
+    # 空のファイル名の場合はデフォルト名を使用
+    if not safe_filename:
+        safe_filename = "unnamed_file"
+
+    return decoded_filename, safe_filename
+
+
+def get_retry_wait(
+    attempt: int, retry_interval: float, error: Optional[Exception] = None
+) -> float:
+    """
+    リトライまでの待機時間を計算（ジッター付き指数バックオフ）
+
+    HTTP 429/503のレスポンスにRetry-Afterヘッダーがある場合はその値を優先する。
+    （極端に大きな値でワーカーが止まらないよう、MAX_RETRY_INTERVALを上限とする）
+
+    Args:
+        attempt: 失敗した試行の番号（0始まり）
+        retry_interval: 初回のリトライ間隔（秒）
+        error: 発生した例外
+
+    Returns:
+        待機時間（秒）
+    """
+    response = getattr(error, "response", None)
+    if response is not None and response.status_code in (429, 503):
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                wait = float(retry_after)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    wait = retry_at.timestamp() - time.time()
+                except (TypeError, ValueError):
+                    logger.debug(f"Retry-Afterヘッダーを解析できません: {retry_after}")
+                    wait = None
+            if wait is not None:
+                return min(MAX_RETRY_INTERVAL, max(0.0, wait))
+
+    # 試行ごとに間隔を2倍にし、同時リトライが重ならないようにジッターを加える
+    wait = min(MAX_RETRY_INTERVAL, retry_interval * (2**attempt))
+    return min(MAX_RETRY_INTERVAL, wait + random.uniform(0, wait / 2))
+
+
 class RedmineAttachment:
     """Redmineの添付ファイルを表すクラス"""
 
+    # チケット一覧の取得ごとに多数生成されるため、属性を固定してメモリ使用量を抑える
+    __slots__ = (
+        "id",
+        "filename",
+        "content_url",
+        "content_type",
+        "filesize",
+        "description",
+        "author",
+        "created_on",
+        "verify_ssl",
+        "auth",
+        "headers",
+        "rate_limiter",
+        "session",
+    )
+
     def __init__(
-        self, attachment_data: Dict, verify_ssl: bool = True, auth=None, headers=None
+        self,
+        attachment_data: Dict,
+        verify_ssl: bool = True,
+        auth=None,
+        headers=None,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None,
     ):
         self.id = attachment_data.get("id")
         self.filename = attachment_data.get("filename", "")
@@ -67,6 +201,8 @@ class RedmineAttachment:
         self.verify_ssl = verify_ssl
         self.auth = auth
         self.headers = headers or {}
+        self.rate_limiter = rate_limiter
+        self.session = session
 
     def download(
         self,
@@ -84,6 +220,51 @@ class RedmineAttachment:
             retry_count: リトライ回数
             retry_interval: リトライ間隔（秒）
 
+        Returns:
+            ダウンロード成功時はTrue
+        """
+        # ファイル名が指定されていない場合は元のファイル名を使用
+        if filename is None:
+            filename = self.filename
+
+        return self.download_to(Path(directory) / filename, retry_count, retry_interval)
+
+    def _open_temp_file(self, directory: Path) -> tuple[int, Path]:
+        """
+        ダウンロード用の一時ファイルを作成して開く
+
+        O_EXCLで作成するため、同じ一時ファイルを複数のダウンロードで共有することはない。
+        （前回の中断で残ったファイルなどと重複した場合は連番を変えて作成する）
+
+        Args:
+            directory: 一時ファイルを作成するディレクトリ（保存先と同じディレクトリ）
+
+        Returns:
+            (fd, temp_path): ファイルディスクリプタと一時ファイルのパスのタプル
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        counter = 0
+        while True:
+            temp_path = directory / f".{self.id}.{counter}.part"
+            try:
+                return os.open(temp_path, flags, 0o666), temp_path
+            except FileExistsError:
+                counter += 1
+
+    def download_to(
+        self,
+        download_path: Path,
+        retry_count: int = 3,
+        retry_interval: float = 5.0,
+    ) -> bool:
+        """
+        添付ファイルを指定したパスにダウンロード
+
+        Args:
+            download_path: 保存先のファイルパス
+            retry_count: リトライ回数
+            retry_interval: リトライ間隔（秒）
+
         Returns:
             ダウンロード成功時はTrue
         """
@@ -102,41 +283,41 @@ class RedmineAttachment:
                 # リトライ回数に応じてタイムアウト時間を計算
                 current_timeout = base_timeout + (attempt * timeout_increment)
 
-                # ファイル名が指定されていない場合は元のファイル名を使用
-                if filename is None:
-                    filename = self.filename
-
-                # ダウンロードパスを構築
-                download_path = Path(directory) / filename
-
-                # ファイルダウンロード用のヘッダーを準備
-                download_headers = {}
-                if self.headers:
-                    # Content-Typeヘッダーを除外（ファイルダウンロードでは不要）
-                    download_headers = {
-                        k: v
-                        for k, v in self.headers.items()
-                        if k.lower() != "content-type"
-                    }
-
                 logger.debug(
                     f"添付ファイルダウンロード開始 ({attempt + 1}回目): {self.filename}, タイムアウト: {current_timeout}秒"
                 )
 
+                # レート制限が設定されている場合は許可を取得するまで待機
+                if self.rate_limiter:
+                    self.rate_limiter.acquire()
+
+                # セッションが指定されている場合は接続を再利用
+                http = self.session if self.session is not None else requests
+
                 # ファイルをダウンロード（認証情報付き、タイムアウト設定付き）
-                response = requests.get(
+                # レスポンスを確実に閉じて接続をコネクションプールに戻す
+                with http.get(
                     self.content_url,
                     stream=True,
                     verify=self.verify_ssl,
                     auth=self.auth,
-                    headers=download_headers,
+                    headers=self.headers,
                     timeout=current_timeout,
-                )
-                response.raise_for_status()
-
-                with open(download_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                ) as response:
+                    response.raise_for_status()
+
+                    # メモリに全体を読み込まず、チャンク単位でディスクに書き込む
+                    # （コピーはshutilに任せ、Python側のループとバッファリングを省く）
+                    # 一時ファイルに書き込んでから置き換え、書き込み途中のファイルを保存先に残さない
+                    response.raw.decode_content = True
+                    fd, temp_path = self._open_temp_file(download_path.parent)
+                    try:
+                        with os.fdopen(fd, "wb", buffering=0) as f:
+                            shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
+                        os.replace(temp_path, download_path)
+                    except BaseException:
+                        temp_path.unlink(missing_ok=True)
+                        raise
 
                 if attempt > 0:
                     logger.info(
@@ -151,8 +332,9 @@ class RedmineAttachment:
                     logger.warning(
                         f"添付ファイルのダウンロードがタイムアウトしました ({attempt + 1}/{retry_count + 1}回目): {self.filename}, タイムアウト: {current_timeout}秒"
                     )
-                    logger.info(f"  {retry_interval}秒後にリトライします...")
-                    time.sleep(retry_interval)
+                    wait = get_retry_wait(attempt, retry_interval, e)
+                    logger.info(f"  {wait:.1f}秒後にリトライします...")
+                    time.sleep(wait)
                 else:
                     logger.error(
                         f"添付ファイルのダウンロードが最終的にタイムアウトしました: {self.filename}, 最終タイムアウト: {current_timeout}秒"
@@ -163,8 +345,9 @@ class RedmineAttachment:
                     logger.warning(
                         f"添付ファイルのダウンロードに失敗しました ({attempt + 1}/{retry_count + 1}回目): {self.filename}, エラー: {e}"
                     )
-                    logger.info(f"  {retry_interval}秒後にリトライします...")
-                    time.sleep(retry_interval)
+                    wait = get_retry_wait(attempt, retry_interval, e)
+                    logger.info(f"  {wait:.1f}秒後にリトライします...")
+                    time.sleep(wait)
                 else:
                     logger.error(
                         f"添付ファイルのダウンロードに最終的に失敗しました: {self.filename}, エラー: {e}"
@@ -177,8 +360,35 @@ class RedmineAttachment:
 class RedmineIssue:
     """Redmineのチケットを表すクラス"""
 
+    # チケット一覧の取得ごとに多数生成されるため、属性を固定してメモリ使用量を抑える
+    __slots__ = (
+        "id",
+        "subject",
+        "description",
+        "status",
+        "priority",
+        "author",
+        "assigned_to",
+        "created_on",
+        "updated_on",
+        "verify_ssl",
+        "auth",
+        "headers",
+        "rate_limiter",
+        "session",
+        "download_concurrency",
+        "_attachments",
+    )
+
     def __init__(
-        self, issue_data: Dict, verify_ssl: bool = True, auth=None, headers=None
+        self,
+        issue_data: Dict,
+        verify_ssl: bool = True,
+        auth=None,
+        headers=None,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None,
+        download_concurrency: int = 8,
     ):
         self.id = issue_data.get("id")
         self.subject = issue_data.get("subject", "")
@@ -192,20 +402,23 @@ class RedmineIssue:
         self.verify_ssl = verify_ssl
         self.auth = auth
         self.headers = headers
+        self.rate_limiter = rate_limiter
+        self.session = session
+        self.download_concurrency = download_concurrency
 
         # 添付ファイルの初期化
-        self._attachments = []
-        attachments_data = issue_data.get("attachments", [])
-        for attachment_data in attachments_data:
-            self._attachments.append(
-                RedmineAttachment(attachment_data, verify_ssl, auth, headers)
+        self._attachments = [
+            RedmineAttachment(
+                attachment_data, verify_ssl, auth, headers, rate_limiter, session
             )
+            for attachment_data in issue_data.get("attachments", ())
+        ]
 
     def get_attachments(self) -> List[RedmineAttachment]:
         return self._attachments
 
     def has_attachments(self) -> bool:
-        return len(self.get_attachments()) > 0
+        return bool(self._attachments)
 
     def _sanitize_filename(self, filename: str) -> str:
         """
@@ -217,26 +430,7 @@ class RedmineIssue:
         Returns:
             安全なファイル名
         """
-        # URLエンコードされたファイル名をデコード
-        try:
-            decoded_filename = urllib.parse.unquote(filename)
-        except Exception as e:
-            logger.warning(
-                f"ファイル名のデコードに失敗しました: {filename}, エラー: {e}"
-            )
-            decoded_filename = filename
-
-        # 危険な文字を置換
-        # Windows/Unix両方で使用できない文字を除去
-        dangerous_chars = r'[<>:"/\\|?*\x00-\x1f]'
-        safe_filename = re.sub(dangerous_chars, "_", decoded_filename)
-
-        # 先頭・末尾の空白とドットを除去
-        safe_filename = safe_filename.strip(" .")
-
-        # 空のファイル名の場合はデフォルト名を使用
-        if not safe_filename:
-            safe_filename = "unnamed_file"
+        decoded_filename, safe_filename = _sanitize(filename)
 
         # ファイル名が変更された場合はログに記録
         if safe_filename != decoded_filename:
@@ -246,77 +440,169 @@ class RedmineIssue:
 
         return safe_filename
 
+    def _download_attachment(
+        self,
+        index: int,
+        attachment: RedmineAttachment,
+        download_path: Path,
+        retry_count: int,
+        retry_interval: float,
+    ) -> bool:
+        """
+        添付ファイル1件をダウンロード
+
+        既に同じサイズのファイルがある場合はダウンロードしない。
+
+        Returns:
+            ダウンロード成功時（スキップした場合を含む）はTrue
+        """
+        total = len(self.get_attachments())
+        try:
+            try:
+                existing_size = download_path.stat().st_size
+            except FileNotFoundError:
+                existing_size = None
+
+            if existing_size is not None and existing_size == attachment.filesize:
+                logger.info(
+                    f"ダウンロード済みのためスキップしました ({index}/{total}): {download_path.name}"
+                )
+                return True
+
+            logger.debug(
+                f"添付ファイルをダウンロード中 ({index}/{total}): {attachment.filename} -> {download_path.name}"
+            )
+
+            if attachment.download_to(download_path, retry_count, retry_interval):
+                logger.info(
+                    f"添付ファイルをダウンロードしました ({index}/{total}): {download_path.name}"
+                )
+                return True
+
+            logger.error(
+                f"添付ファイルのダウンロードに失敗しました: {attachment.filename}"
+            )
+            return False
+
+        except Exception as e:
+            logger.error(
+                f"添付ファイルのダウンロードに失敗しました: {attachment.filename}, エラー: {e}"
+            )
+            return False
+
+    def _download_attachments_concurrently(
+        self,
+        download_paths: List[Path],
+        retry_count: int,
+        retry_interval: float,
+        executor: Executor,
+    ):
+        """添付ファイルをExecutorで並行してダウンロード（全件の完了を待機）"""
+        futures = [
+            executor.submit(
+                self._download_attachment,
+                i,
+                attachment,
+                download_path,
+                retry_count,
+                retry_interval,
+            )
+            for i, (attachment, download_path) in enumerate(
+                zip(self.get_attachments(), download_paths), 1
+            )
+        ]
+        for future in futures:
+            future.result()
+
     def download_attachments(
         self,
         download_dir: str,
         download_interval: float = 0.0,
         retry_count: int = 3,
         retry_interval: float = 5.0,
+        executor: Optional[Executor] = None,
     ):
         """
         添付ファイルをダウンロード（ファイル名をデコードして保存）
 
+        同名のファイルが既にディレクトリに存在する場合は上書きする。
+        ただし、サイズが一致する場合はダウンロード済みとしてダウンロードしない。
+        チケット内で同名の添付ファイルがある場合は連番を付与して保存する。
+
         Args:
             download_dir: ダウンロードディレクトリ
-            download_interval: ファイルダウンロード間の待機時間（秒）
+            download_interval: ファイルダウンロード間の待機時間（秒）（executor指定時は使用しない）
             retry_count: リトライ回数
             retry_interval: リトライ間隔（秒）
+            executor: 指定した場合は添付ファイルをこのExecutorで並行してダウンロード
+                （未指定でdownload_intervalが0の場合はdownload_concurrencyの数まで並行してダウンロード）
         """
-        for i, attachment in enumerate(self.get_attachments(), 1):
-            try:
-                # 元のファイル名を取得
-                original_filename = attachment.filename
-
-                # ファイル名をデコードして安全な形式に変換
-                safe_filename = self._sanitize_filename(original_filename)
-
-                # ダウンロードパスを構築
-                download_path = Path(download_dir) / safe_filename
-
-                # ファイルが既に存在する場合は連番を付与
-                counter = 1
-                while download_path.exists():
-                    name, ext = os.path.splitext(safe_filename)
-                    download_path = Path(download_dir) / f"{name}_{counter}{ext}"
+        attachments = self.get_attachments()
+        total = len(attachments)
+
+        # このチケットで使用済みのファイル名（大文字小文字を区別しないファイルシステムを考慮）
+        used_filenames = set()
+        # ファイル名ごとに次に試す連番（同名ファイルが多数ある場合に1から探し直さないようにする）
+        next_counters: Dict[str, int] = {}
+        download_paths = []
+        download_dir_path = Path(download_dir)
+
+        for attachment in attachments:
+            # ファイル名をデコードして安全な形式に変換
+            safe_filename = self._sanitize_filename(attachment.filename)
+
+            # ダウンロードパスを構築
+            download_path = download_dir_path / safe_filename
+
+            # チケット内で同名のファイルがある場合は連番を付与
+            key = safe_filename.lower()
+            if key in used_filenames:
+                name, ext = os.path.splitext(safe_filename)
+                counter = next_counters.get(key, 1)
+                while download_path.name.lower() in used_filenames:
+                    download_path = download_dir_path / f"{name}_{counter}{ext}"
                     counter += 1
-
-                # ファイルをダウンロード
-                logger.debug(
-                    f"添付ファイルをダウンロード中 ({i}/{len(self.get_attachments())}): {original_filename} -> {download_path.name}"
+                next_counters[key] = counter
+            used_filenames.add(download_path.name.lower())
+            download_paths.append(download_path)
+
+        # ダウンロード間隔を設定しない場合は、Executorが指定されていなくても並行ダウンロード
+        if executor is None and download_interval <= 0 and total > 1:
+            with ThreadPoolExecutor(
+                min(self.download_concurrency, total)
+            ) as local_executor:
+                self._download_attachments_concurrently(
+                    download_paths, retry_count, retry_interval, local_executor
                 )
+            return
 
-                if attachment.download(
-                    str(download_path.parent),
-                    download_path.name,
-                    retry_count,
-                    retry_interval,
-                ):
-                    logger.info(
-                        f"添付ファイルをダウンロードしました ({i}/{len(self.get_attachments())}): {download_path.name}"
-                    )
-                else:
-                    logger.error(
-                        f"添付ファイルのダウンロードに失敗しました: {original_filename}"
-                    )
+        # ファイル名を確定してから並行ダウンロード（保存先が重複しないようにする）
+        if executor is not None:
+            self._download_attachments_concurrently(
+                download_paths, retry_count, retry_interval, executor
+            )
+            return
 
-                # ファイルダウンロード間隔を設定（最後のファイル以外）
-                if download_interval > 0 and i < len(self.get_attachments()):
-                    logger.debug(
-                        f"  ファイルダウンロード間隔待機: {download_interval}秒"
-                    )
-                    time.sleep(download_interval)
+        for i, (attachment, download_path) in enumerate(
+            zip(attachments, download_paths), 1
+        ):
+            self._download_attachment(
+                i, attachment, download_path, retry_count, retry_interval
+            )
 
-            except Exception as e:
-                logger.error(
-                    f"添付ファイルのダウンロードに失敗しました: {attachment.filename}, エラー: {e}"
-                )
+            # ファイルダウンロード間隔を設定（最後のファイル以外）
+            if download_interval > 0 and i < total:
+                logger.debug(f"  ファイルダウンロード間隔待機: {download_interval}秒")
+                time.sleep(download_interval)
 
 
 class RedmineIssueList(Sequence):
     """Redmineのチケット一覧を表すクラス"""
 
-    def __init__(self, issues: List[RedmineIssue]):
+    def __init__(self, issues: List[RedmineIssue], total_count: Optional[int] = None):
         self.issues = issues
+        # 条件に一致するチケットの総数（APIレスポンスのtotal_count）
+        self.total_count = total_count
 
     def __len__(self) -> int:
         return len(self.issues)
@@ -330,20 +616,19 @@ class RedmineClient:
 
     使用例:
         # APIキーでチケット取得、ユーザ名・パスワードでファイルダウンロード
-        client = RedmineClient(
+        with RedmineClient(
             base_url="https://your-redmine.com",
             api_key="your_api_key",           # チケット取得用
             username="your_username",         # ファイルダウンロード用
             password="your_password"          # ファイルダウンロード用
-        )
-
-        # チケットを取得
-        issues = client.get_issues(limit=10)
-
-        # 添付ファイルをダウンロード（Basic認証で実行）
-        for issue in issues:
-            if issue.has_attachments():
-                issue.download_attachments("./downloads")
+        ) as client:
+            # チケットを取得
+            issues = client.get_issues(limit=10)
+
+            # 添付ファイルをダウンロード（Basic認証で実行）
+            for issue in issues:
+                if issue.has_attachments():
+                    issue.download_attachments("./downloads")
     """
 
     def __init__(
@@ -353,6 +638,9 @@ class RedmineClient:
         username: str = None,
         password: str = None,
         verify_ssl: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        pool_size: int = 10,
+        download_concurrency: int = 8,
     ):
         """
         RedmineClientの初期化
@@ -363,10 +651,24 @@ class RedmineClient:
             username: ユーザ名（ファイルダウンロード用）
             password: パスワード（ファイルダウンロード用）
             verify_ssl: SSL証明書の検証を行うかどうか（デフォルト: True）
+            rate_limiter: APIリクエストとファイルダウンロードに適用するレートリミッター
+            pool_size: 接続を保持するコネクションプールのサイズ（同時ダウンロード数以上を推奨）
+            download_concurrency: チケット内の添付ファイルを並行してダウンロードする際の同時ダウンロード数
         """
         self.base_url = base_url.rstrip("/")
         self.verify_ssl = verify_ssl
+        self.rate_limiter = rate_limiter
+        self.download_concurrency = download_concurrency
+
+        # APIリクエスト用とファイルダウンロード用のセッション
+        # 両セッションで同じコネクションプールを共有し、同一ホストへの
+        # TCP/TLSハンドシェイクを全リクエストを通じて最小限にする
         self.session = requests.Session()
+        self.download_session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=pool_size)
+        for session in (self.session, self.download_session):
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
 
         # SSL検証設定を適用
         if not verify_ssl:
@@ -390,6 +692,14 @@ class RedmineClient:
             )
             logger.info("APIキー認証でRedmineクライアントを初期化しました")
 
+        # ファイルダウンロード用のヘッダー（Content-Typeはファイルダウンロードでは不要なため除外）
+        # 添付ファイルごとに作り直さないよう一度だけ作成して共有する
+        self.download_headers = {
+            k: v
+            for k, v in self.session.headers.items()
+            if k.lower() != "content-type"
+        }
+
         # ユーザ名・パスワード認証（ファイルダウンロード用）
         if username and password:
             # ファイルダウンロード用の認証情報を保存
@@ -401,6 +711,11 @@ class RedmineClient:
             self.download_auth = None
             logger.warning("ファイルダウンロード用の認証情報が設定されていません")
 
+        # セッション自体にも認証情報とSSL検証設定を持たせ、セッションを直接使う場合も同じ設定にする
+        self.download_session.auth = self.download_auth
+        for session in (self.session, self.download_session):
+            session.verify = verify_ssl
+
         # 最低限の認証情報チェック
         if not api_key and not (username and password):
             raise ValueError(
@@ -435,13 +750,22 @@ class RedmineClient:
                     f"APIリクエスト開始 ({attempt + 1}回目): {url}, タイムアウト: {current_timeout}秒"
                 )
 
+                # レート制限が設定されている場合は許可を取得するまで待機
+                if self.rate_limiter:
+                    self.rate_limiter.acquire()
+
                 response = self.session.get(
                     url, params=params, verify=self.verify_ssl, timeout=current_timeout
                 )
                 response.raise_for_status()
 
-                # JSONレスポンスを解析
-                data = response.json()
+                # JSONレスポンスを解析（解析エラーもリトライ対象とする）
+                try:
+                    data = parse_json(response.content)
+                except ValueError as e:
+                    raise requests.exceptions.InvalidJSONError(
+                        f"JSONの解析に失敗しました: {e}", response=response
+                    ) from e
                 logger.debug(f"APIリクエスト成功: {url}")
                 return data
 
@@ -450,8 +774,9 @@ class RedmineClient:
                     logger.warning(
                         f"APIリクエストがタイムアウトしました ({attempt + 1}/{retry_count + 1}回目): {url}, タイムアウト: {current_timeout}秒"
                     )
-                    logger.info(f"  {retry_interval}秒後にリトライします...")
-                    time.sleep(retry_interval)
+                    wait = get_retry_wait(attempt, retry_interval, e)
+                    logger.info(f"  {wait:.1f}秒後にリトライします...")
+                    time.sleep(wait)
                 else:
                     logger.error(
                         f"APIリクエストが最終的にタイムアウトしました: {url}, 最終タイムアウト: {current_timeout}秒"
@@ -462,16 +787,83 @@ class RedmineClient:
                     logger.warning(
                         f"APIリクエストに失敗しました ({attempt + 1}/{retry_count + 1}回目): {url}, エラー: {e}"
                     )
-                    logger.info(f"  {retry_interval}秒後にリトライします...")
-                    time.sleep(retry_interval)
+                    wait = get_retry_wait(attempt, retry_interval, e)
+                    logger.info(f"  {wait:.1f}秒後にリトライします...")
+                    time.sleep(wait)
                 else:
                     logger.error(
                         f"APIリクエストに最終的に失敗しました: {url}, エラー: {e}"
                     )
                     raise
 
+    def _fetch_issues(
+        self,
+        limit: int,
+        offset: int,
+        sort: str,
+        only_with_attachments: bool,
+    ) -> RedmineIssueList:
+        """
+        チケット一覧を1ページ取得（失敗時は例外を送出）
+
+        Args:
+            limit: 取得件数
+            offset: オフセット
+            sort: ソート順
+            only_with_attachments: 添付ファイルのあるチケットのみをサーバー側で絞り込むかどうか
+
+        Returns:
+            チケット一覧
+        """
+        # APIパラメータを構築（添付ファイル情報は一覧取得と同時に取得する）
+        params = {
+            "limit": limit,
+            "offset": offset,
+            "sort": sort,
+            "include": "attachments",
+        }
+
+        if only_with_attachments:
+            # 添付ファイルフィルタを使用（f[]形式ではステータス条件も同じ形式で指定する）
+            params.update(
+                {
+                    "f[]": ["status_id", "attachment"],
+                    "op[status_id]": "*",
+                    "op[attachment]": "*",
+                }
+            )
+        else:
+            params["status_id"] = "*"
+
+        # Redmine REST APIを呼び出し
+        data = self._make_request("/issues.json", params)
+
+        # レスポンスからチケット一覧を構築
+        issues = []
+        for issue_data in data.get("issues", []):
+            issues.append(
+                RedmineIssue(
+                    issue_data,
+                    self.verify_ssl,
+                    self.download_auth,  # ファイルダウンロード用の認証情報
+                    self.download_headers,
+                    self.rate_limiter,
+                    self.download_session,
+                    self.download_concurrency,
+                )
+            )
+
+        logger.debug(
+            f"チケット取得リクエスト完了: limit={limit}, offset={offset}, 取得件数={len(issues)}"
+        )
+        return RedmineIssueList(issues, data.get("total_count"))
+
     def get_issues(
-        self, limit: int = 10, offset: int = 0, sort: str = "created_on:asc"
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        sort: str = "created_on:asc",
+        only_with_attachments: bool = False,
     ) -> RedmineIssueList:
         """
         チケット一覧を取得
@@ -480,41 +872,94 @@ class RedmineClient:
             limit: 取得件数
             offset: オフセット
             sort: ソート順
+            only_with_attachments: 添付ファイルのあるチケットのみをサーバー側で絞り込むかどうか
 
         Returns:
             チケット一覧
         """
         try:
-            # APIパラメータを構築
-            params = {
-                "limit": limit,
-                "offset": offset,
-                "sort": sort,
-                "include": "attachments",
-                "status_id": "*",
-            }
-
-            # Redmine REST APIを呼び出し
-            data = self._make_request("/issues.json", params)
-
-            # レスポンスからチケット一覧を構築
-            issues = []
-            for issue_data in data.get("issues", []):
-                issues.append(
-                    RedmineIssue(
-                        issue_data,
-                        self.verify_ssl,
-                        self.download_auth,  # ファイルダウンロード用の認証情報
-                        self.session.headers,
-                    )
-                )
-
-            logger.debug(
-                f"チケット取得リクエスト完了: limit={limit}, offset={offset}, 取得件数={len(issues)}"
-            )
-            return RedmineIssueList(issues)
+            return self._fetch_issues(limit, offset, sort, only_with_attachments)
 
         except Exception as e:
             logger.error(f"チケット取得に失敗しました: {e}")
             # エラーが発生した場合は空のリストを返す
             return RedmineIssueList([])
+
+    def get_all_issues(
+        self,
+        limit: int = 100,
+        offset_start: int = 0,
+        offset_end: int = 0,
+        sort: str = "created_on:asc",
+        only_with_attachments: bool = False,
+        max_workers: int = 4,
+    ) -> RedmineIssueList:
+        """
+        指定範囲のチケットを全件取得
+
+        最初のページでtotal_countを確認し、2ページ目以降は並行して取得する。
+        いずれかのページの取得に失敗した場合は、欠けた一覧を返さずに例外を送出する。
+
+        Args:
+            limit: 1ページあたりの取得件数
+            offset_start: 取得開始オフセット
+            offset_end: 取得終了オフセット（0の場合は最後まで）
+            sort: ソート順
+            only_with_attachments: 添付ファイルのあるチケットのみをサーバー側で絞り込むかどうか
+            max_workers: 同時に取得するページ数
+
+        Returns:
+            チケット一覧
+        """
+        # 取得範囲が空の場合はリクエストしない（逐次取得と同じ範囲を対象にする）
+        if offset_end > 0 and offset_start >= offset_end:
+            logger.info(
+                f"指定された範囲の終端に到達しました: {offset_start} >= {offset_end}"
+            )
+            return RedmineIssueList([])
+
+        first_page = self._fetch_issues(limit, offset_start, sort, only_with_attachments)
+        if first_page.total_count is None or len(first_page) < limit:
+            return first_page
+
+        end = first_page.total_count
+        if offset_end > 0:
+            end = min(end, offset_end)
+        offsets = range(offset_start + limit, end, limit)
+
+        issues = list(first_page)
+        with ThreadPoolExecutor(max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._fetch_issues, limit, offset, sort, only_with_attachments
+                )
+                for offset in offsets
+            ]
+            for offset, future in zip(offsets, futures):
+                try:
+                    page = future.result()
+                except Exception as e:
+                    # 未着手のページは取得しない
+                    for pending in futures:
+                        pending.cancel()
+                    logger.error(f"チケット取得に失敗しました (offset={offset}): {e}")
+                    raise
+                issues.extend(page)
+
+        logger.debug(
+            f"チケット全件取得完了: ページ数={len(offsets) + 1}, 取得件数={len(issues)}"
+        )
+        return RedmineIssueList(issues, first_page.total_count)
+
+    def close(self):
+        """セッションを閉じてプール中の接続を解放"""
+        self.session.close()
+        self.download_session.close()
+
+    def __enter__(self):
+        """コンテキストマネージャーのエントリーポイント"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """コンテキストマネージャーのエグジットポイント"""
+        self.close()